@@ -1,13 +1,29 @@
+import collections
+import itertools
+import numbers
+import os
+import queue
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Deque
 import logging
 import cv2
 import numpy as np
-from datetime import datetime
 import threading
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
 
+try:
+    import liburing
+except ImportError:  # io_uring batching is optional, plain os.write is used without it
+    liburing = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the classifier runs as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
 class MovementType(Enum):
@@ -16,15 +32,83 @@ class MovementType(Enum):
     FALL = "fall"
     WALKING = "walking"
 
-@dataclass
+# Enum values indexed by how many thresholds the movement exceeds
+_MOVEMENT_TYPES = (
+    MovementType.NONE.value,
+    MovementType.WALKING.value,
+    MovementType.RUNNING.value,
+    MovementType.FALL.value,
+)
+
+@njit(cache=True)
+def _classify(m, thresholds, movement_sum):
+    """
+    Map a movement sum to (type code, confidence) given the sorted
+    [movement, running, fall] thresholds as integer pixel-difference sums
+    and the unrounded movement threshold sum used for confidence.
+    """
+    c = min(m / movement_sum, 1.0)
+    # side="left" counts thresholds strictly below m, i.e. m > threshold
+    t = np.searchsorted(thresholds, m, side="left")
+    return t, c
+
+# Compile once at import rather than on the first capture
+_classify(0, np.array([1, 2, 3], dtype=np.int64), 1.0)
+
+def _cuda_available() -> bool:
+    """
+    Check whether OpenCV was built with CUDA and a device is present.
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+def _validate_settings(settings: "CameraSettings") -> Optional[str]:
+    """
+    Return a description of the first invalid camera setting, or None.
+    """
+    for name in ("movement_threshold", "running_threshold", "fall_threshold"):
+        value = getattr(settings, name)
+        if not isinstance(value, numbers.Real) or isinstance(value, bool):
+            return f"{name} must be a number"
+        if not value > 0:
+            return f"{name} must be positive"
+    # _classify binary-searches these, so they must be in ascending order
+    if not (settings.movement_threshold <= settings.running_threshold <= settings.fall_threshold):
+        return "thresholds must satisfy movement_threshold <= running_threshold <= fall_threshold"
+    if settings.channel_index is not None and settings.channel_index not in (0, 1, 2):
+        return "channel_index must be 0, 1, 2 or None"
+    resolution = settings.motion_resolution
+    if (not isinstance(resolution, (tuple, list)) or len(resolution) != 2
+            or not all(isinstance(v, int) and not isinstance(v, bool) and v > 0 for v in resolution)):
+        return "motion_resolution must be a (width, height) tuple of positive integers"
+    history_size = settings.history_size
+    if not isinstance(history_size, int) or isinstance(history_size, bool) or history_size < 0:
+        return "history_size must be a non-negative integer"
+    return None
+
+@dataclass(slots=True, frozen=True)
 class CameraSettings:
+    # Frozen so values cached from it cannot go stale; use
+    # BeltTracking.update_settings to change settings.
+    #
+    # Movement thresholds are compared against the mean absolute pixel
+    # difference, which does not depend on image size, so they hold for
+    # any motion_resolution.
     timer_interval: float = 60.0  # seconds between timer-based captures
     movement_threshold: float = 30.0  # threshold for movement detection
     fall_threshold: float = 50.0  # threshold for fall detection
     running_threshold: float = 40.0  # threshold for running detection
     save_directory: str = "captures"
     resolution: tuple = (640, 480)
+    motion_resolution: tuple = (80, 60)  # frames are downsampled to this size for movement detection
+    # BGR channel diffed for movement (1 = green, which tracks luminance closely);
+    # None converts to full grayscale instead.
+    channel_index: Optional[int] = 1
     fps: int = 30
+    jpeg_quality: int = 85
+    history_size: int = 256  # most recent movement results kept in memory
 
 class BeltTracking:
     def __init__(self, camera_settings: Optional[CameraSettings] = None):
@@ -36,18 +120,133 @@ class BeltTracking:
         
         # Camera related attributes
         self._camera_settings = camera_settings or CameraSettings()
+        error = _validate_settings(self._camera_settings)
+        if error:
+            raise ValueError(error)
         self._camera: Optional[cv2.VideoCapture] = None
         self._timer_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._write_queue: Optional[queue.Queue] = None
+        self._encode_pool: Optional[ThreadPoolExecutor] = None
+        # (future, filename) of recent encodes; the oldest is dropped when full
+        self._encode_futures: Deque[tuple] = collections.deque(maxlen=8)
         self._is_capturing: bool = False
-        self._last_frame: Optional[np.ndarray] = None
-        self._movement_history: List[Dict[str, Any]] = []
+        self._capture_lock = threading.Lock()
+        # Spare BGR frames to read into; a frame is owned by its encode job
+        # until that finishes, then returns here
+        self._free_frames: Deque[np.ndarray] = collections.deque(maxlen=4)
+        self._small_buf: Optional[np.ndarray] = None
+        self._bufs: List[np.ndarray] = []
+        self._cur: int = 0
+        self._motion_pixels: int = 0
+        # Thresholds scaled by _motion_pixels so they compare against raw sums
+        self._thresholds: Optional[np.ndarray] = None
+        self._movement_sum: float = 0.0
+        # GPU counterparts of the motion buffers, used when CUDA is available
+        self._use_cuda: bool = False
+        self._d_frame = None
+        self._d_small = None
+        self._d_planes: List[Any] = []
+        self._d_bufs: List[Any] = []
+        self._d_diff = None
+        self._movement_history: Deque[Dict[str, Any]] = collections.deque(
+            maxlen=self._camera_settings.history_size)
         self._capture_count: int = 0
+        # Incremented from the encode pool and the writer thread
+        self._stats_lock = threading.Lock()
+        self._failed_writes: int = 0
+        self._dropped_captures: int = 0
+        self._filename_prefix: str = ""
+        self._settings_snapshot: Dict[str, Any] = {}
+        self._cache_settings()
+        self._refresh_thresholds()
+
+    def _cache_settings(self):
+        """
+        Precompute values derived from the camera settings that are
+        otherwise rebuilt on every capture or stats call.
+        """
+        self._filename_prefix = f"{self._camera_settings.save_directory}/capture_"
+        self._settings_snapshot = asdict(self._camera_settings)
+
+    def _refresh_thresholds(self):
+        """
+        Copy the movement thresholds into plain instance attributes, scaled
+        by the motion pixel count so they compare against raw diff sums.
+        """
+        settings = self._camera_settings
+        width, height = settings.motion_resolution
+        self._motion_pixels = width * height
+        # Sums are integers, so sum > int(t * N) is exactly mean > t
+        self._thresholds = np.array(
+            [int(t * self._motion_pixels) for t in (
+                settings.movement_threshold, settings.running_threshold, settings.fall_threshold)],
+            dtype=np.int64)
+        # Confidence divides by the exact scaled threshold, which the integer
+        # version would truncate towards zero for small thresholds
+        self._movement_sum = settings.movement_threshold * self._motion_pixels
+
+    def update_settings(self, **changes) -> Dict[str, Any]:
+        """
+        Replace the given camera settings and refresh everything cached from them.
+        Changes to resolution and fps take effect on the next start_camera.
+        """
+        # The live motion buffers were sized and seeded for these
+        for name in ("motion_resolution", "channel_index"):
+            if (self._is_capturing and name in changes
+                    and changes[name] != getattr(self._camera_settings, name)):
+                return {
+                    "status": "error",
+                    "message": f"{name} cannot change while capturing"
+                }
+        try:
+            settings = replace(self._camera_settings, **changes)
+        except TypeError as e:
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+        error = _validate_settings(settings)
+        if error:
+            return {
+                "status": "error",
+                "message": error
+            }
+        if settings.save_directory != self._camera_settings.save_directory:
+            try:
+                os.makedirs(settings.save_directory, exist_ok=True)
+            except OSError as e:
+                return {
+                    "status": "error",
+                    "message": str(e)
+                }
+        
+        # Held so a concurrent capture never sees a half-updated set of thresholds
+        with self._capture_lock:
+            # Built before any state is replaced, so nothing is left half-applied
+            history = self._movement_history
+            if settings.history_size != history.maxlen:
+                history = collections.deque(history, maxlen=settings.history_size)
+            self._camera_settings = settings
+            self._movement_history = history
+            self._cache_settings()
+            self._refresh_thresholds()
+        
+        return {
+            "status": "success",
+            "message": "Settings updated successfully",
+            "settings": self._settings_snapshot
+        }
 
     def start_camera(self) -> Dict[str, Any]:
         """
         Initialize and start the camera with the specified settings.
         """
         try:
+            # Created once up front; a missing directory would otherwise fail every write
+            os.makedirs(self._camera_settings.save_directory, exist_ok=True)
+            
             self._camera = cv2.VideoCapture(0)
             self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, self._camera_settings.resolution[0])
             self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self._camera_settings.resolution[1])
@@ -56,16 +255,32 @@ class BeltTracking:
             if not self._camera.isOpened():
                 raise RuntimeError("Failed to open camera")
             
-            self._is_capturing = True
+            # The first frame's array becomes a spare for later reads, so spares
+            # match the shape the camera actually delivers
+            ret, frame = self._camera.read()
+            if not ret:
+                raise RuntimeError("Failed to capture initial frame")
+            self._init_motion_buffers(frame)
+            self._free_frames.clear()
+            self._free_frames.append(frame)
+            
+            self._start_writer()
+            self._encode_pool = ThreadPoolExecutor(max_workers=2)
+            # Only flip the flag once everything capture_image uses exists
+            with self._capture_lock:
+                self._is_capturing = True
             self._start_timer_capture()
             
             return {
                 "status": "success",
                 "message": "Camera started successfully",
-                "settings": self._camera_settings.__dict__
+                "settings": self._settings_snapshot
             }
         except Exception as e:
-            logger.error(f"Failed to start camera: {str(e)}")
+            logger.error("Failed to start camera: %s", e)
+            if self._camera is not None:
+                self._camera.release()
+                self._camera = None
             return {
                 "status": "error",
                 "message": str(e)
@@ -75,7 +290,32 @@ class BeltTracking:
         """
         Stop the camera and cleanup resources.
         """
-        self._is_capturing = False
+        # Taken so an in-flight capture finishes submitting its encode first;
+        # captures that get the lock afterwards see _is_capturing False and bail
+        with self._capture_lock:
+            self._is_capturing = False
+        self._stop_event.set()
+        if self._timer_thread is not None:
+            # Wakes immediately from its wait instead of finishing the interval
+            self._timer_thread.join(timeout=2.0)
+            self._timer_thread = None
+        if self._encode_pool is not None:
+            # Let queued encodes reach the writer before it is told to stop
+            self._encode_pool.shutdown(wait=True)
+            self._encode_pool = None
+            self._encode_futures.clear()
+        if self._writer_thread is not None:
+            # Sentinel tells the writer to flush what it has and exit; the put is
+            # timed so a stuck writer cannot hang stop_camera
+            if self._writer_thread.is_alive():
+                try:
+                    self._write_queue.put(None, timeout=2.0)
+                except queue.Full:
+                    logger.error("Writer is not draining, abandoning %d queued captures",
+                                 self._write_queue.qsize())
+                else:
+                    self._writer_thread.join(timeout=2.0)
+            self._writer_thread = None
         if self._camera is not None:
             self._camera.release()
             self._camera = None
@@ -90,13 +330,147 @@ class BeltTracking:
         Start the timer-based capture thread.
         """
         def timer_capture():
-            while self._is_capturing:
+            while not self._stop_event.is_set():
                 self.capture_image("timer")
-                time.sleep(self._camera_settings.timer_interval)
+                self._stop_event.wait(self._camera_settings.timer_interval)
         
+        self._stop_event.clear()
         self._timer_thread = threading.Thread(target=timer_capture, daemon=True)
         self._timer_thread.start()
 
+    def _start_writer(self):
+        """
+        Start the thread that writes encoded captures to disk.
+        """
+        self._write_queue = queue.Queue(maxsize=32)
+        # The queue is bound to this writer, so one that outlives stop_camera
+        # never drains the queue of a later start_camera
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, args=(self._write_queue,), daemon=True)
+        self._writer_thread.start()
+
+    def _writer_loop(self, write_queue: queue.Queue, max_batch: int = 8):
+        """
+        Drain the write queue in batches of up to max_batch files.
+        With liburing available each batch is submitted with a single
+        io_uring_submit call, otherwise files are written one by one.
+        """
+        ring = None
+        if liburing is not None:
+            try:
+                ring = liburing.io_uring()
+                liburing.io_uring_queue_init(max_batch, ring, 0)
+            except OSError as e:
+                logger.warning("io_uring unavailable, using os.write: %s", e)
+                ring = None
+        
+        try:
+            stopping = False
+            while not stopping:
+                item = write_queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                while len(batch) < max_batch:
+                    try:
+                        item = write_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                try:
+                    ring = self._write_batch(ring, batch)
+                except Exception:
+                    # Keep draining; a dead writer would block the encoders on a full queue
+                    logger.exception("Writer failed on a batch of %d captures", len(batch))
+                    for _ in batch:
+                        self._count_failed_write()
+        finally:
+            if ring is not None:
+                liburing.io_uring_queue_exit(ring)
+
+    def _write_batch(self, ring, batch: List[tuple]):
+        """
+        Write a batch of (filename, data) pairs to disk.
+        Returns the ring to use for the next batch, or None once io_uring
+        has failed and the writer should stay on plain writes.
+        """
+        # Filenames have one-second resolution, so a batch can name the same
+        # file twice; keep only the last capture so its data isn't overlaid
+        # on the earlier, longer one
+        latest = {filename: data for filename, data in batch}
+        
+        pending = []
+        for filename, data in latest.items():
+            try:
+                fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            except OSError as e:
+                logger.error("Failed to open %s: %s", filename, e)
+                self._count_failed_write()
+                continue
+            pending.append((fd, filename, data))
+        
+        submitted = False
+        if ring is not None and pending:
+            try:
+                for fd, filename, data in pending:
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_write(sqe, fd, data, len(data), 0)
+                liburing.io_uring_submit(ring)
+                submitted = True
+                
+                cqe = liburing.io_uring_cqe()
+                for _ in pending:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    if cqe.res < 0:
+                        logger.warning("io_uring write failed: %s", os.strerror(-cqe.res))
+                    liburing.io_uring_cqe_seen(ring, cqe)
+            except Exception as e:
+                # Don't leave queued entries behind that reference fds closed below
+                logger.warning("io_uring failed, using os.write: %s", e)
+                liburing.io_uring_queue_exit(ring)
+                ring = None
+        
+        try:
+            for fd, filename, data in pending:
+                try:
+                    # Completions are not tied back to files, so check what actually
+                    # landed; this also finishes short or failed io_uring writes
+                    written = os.fstat(fd).st_size if submitted else 0
+                    if written < len(data):
+                        if written:
+                            logger.warning("Short write to %s (%d of %d bytes), completing it",
+                                           filename, written, len(data))
+                        self._write_all(fd, data, written)
+                except OSError as e:
+                    logger.error("Failed to write %s: %s", filename, e)
+                    self._count_failed_write()
+        finally:
+            for fd, filename, _ in pending:
+                try:
+                    os.close(fd)
+                except OSError as e:
+                    logger.error("Failed to close %s: %s", filename, e)
+        return ring
+
+    def _count_failed_write(self):
+        """
+        Record one capture that could not be encoded or written.
+        """
+        with self._stats_lock:
+            self._failed_writes += 1
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes, offset: int = 0):
+        """
+        Write data[offset:] to fd at offset, looping over partial writes.
+        """
+        view = memoryview(data)
+        while offset < len(view):
+            offset += os.pwrite(fd, view[offset:], offset)
+
     def capture_image(self, trigger: str = "manual") -> Dict[str, Any]:
         """
         Capture an image and detect movement.
@@ -107,19 +481,42 @@ class BeltTracking:
                 "message": "Camera not initialized or not capturing"
             }
 
-        ret, frame = self._camera.read()
-        if not ret:
-            return {
-                "status": "error",
-                "message": "Failed to capture frame"
-            }
-
-        movement_data = self._detect_movement(frame)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self._camera_settings.save_directory}/capture_{timestamp}_{trigger}.jpg"
-        
-        cv2.imwrite(filename, frame)
-        self._capture_count += 1
+        # The frame, motion buffers and encode pool share state across callers
+        with self._capture_lock:
+            # stop_camera may have run since the check above
+            if not self._is_capturing:
+                return {
+                    "status": "error",
+                    "message": "Camera not initialized or not capturing"
+                }
+            
+            # Reuse a spare frame if one is free, otherwise let OpenCV allocate
+            spare = self._free_frames.pop() if self._free_frames else None
+            ret, frame = self._camera.read(spare)
+            if not ret:
+                if spare is not None:
+                    self._free_frames.append(spare)
+                return {
+                    "status": "error",
+                    "message": "Failed to capture frame"
+                }
+            
+            movement_data = self._detect_movement(frame)
+            
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = self._filename_prefix + timestamp + "_" + trigger + ".jpg"
+            
+            # Encode off the capture thread; drop the oldest pending encode when backed up
+            if len(self._encode_futures) == self._encode_futures.maxlen:
+                oldest, oldest_filename = self._encode_futures[0]
+                if oldest.cancel():
+                    logger.warning("Dropped pending capture %s, encoder is backed up", oldest_filename)
+                    self._dropped_captures += 1
+            future = self._encode_pool.submit(self._encode_and_write, frame, filename)
+            # The frame goes back to the spares once encoded, or once cancelled
+            future.add_done_callback(lambda _, frame=frame: self._free_frames.append(frame))
+            self._encode_futures.append((future, filename))
+            self._capture_count += 1
         
         return {
             "status": "success",
@@ -129,39 +526,115 @@ class BeltTracking:
             "timestamp": timestamp
         }
 
-    def _detect_movement(self, frame: np.ndarray) -> Dict[str, Any]:
+    def _encode_and_write(self, frame: np.ndarray, filename: str):
         """
-        Detect movement type in the frame.
+        Encode the frame as JPEG and hand it to the writer thread.
+        Runs on the encode pool; OpenCV releases the GIL while encoding.
         """
-        if self._last_frame is None:
-            self._last_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            return {"type": MovementType.NONE.value, "confidence": 0.0}
+        ok, buf = cv2.imencode(".jpg", frame,
+                               [cv2.IMWRITE_JPEG_QUALITY, self._camera_settings.jpeg_quality])
+        if not ok:
+            logger.error("Failed to encode %s", filename)
+            self._count_failed_write()
+            return
+        self._write_queue.put((filename, buf.tobytes()))
 
-        # Convert current frame to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    def _init_motion_buffers(self, frame: np.ndarray):
+        """
+        Allocate the downsampled frame buffer and the pair of grayscale
+        buffers that alternate between "current" and "previous", then seed
+        both from frame so the first diff is meaningful. The buffers live on
+        the GPU when OpenCV has a usable CUDA device.
+        """
+        width, height = self._camera_settings.motion_resolution
+        self._cur = 0
+        self._use_cuda = _cuda_available()
         
-        # Calculate absolute difference between frames
-        frame_diff = cv2.absdiff(self._last_frame, gray)
-        movement = np.mean(frame_diff)
+        if self._use_cuda:
+            try:
+                self._d_frame = cv2.cuda_GpuMat()
+                self._d_small = cv2.cuda_GpuMat(height, width, cv2.CV_8UC3)
+                self._d_planes = [cv2.cuda_GpuMat(height, width, cv2.CV_8UC1) for _ in range(3)]
+                self._d_bufs = [cv2.cuda_GpuMat(height, width, cv2.CV_8UC1) for _ in range(2)]
+                self._d_diff = cv2.cuda_GpuMat(height, width, cv2.CV_8UC1)
+                self._d_frame.upload(frame)
+                self._to_motion_gray_cuda(self._d_bufs[0])
+                self._d_bufs[0].copyTo(self._d_bufs[1])
+            except (AttributeError, cv2.error) as e:
+                # A device alone is not enough, e.g. builds without cudawarping
+                logger.warning("CUDA motion detection unavailable, using CPU: %s", e)
+                self._use_cuda = False
+                self._d_frame = self._d_small = self._d_diff = None
+                self._d_planes = []
+                self._d_bufs = []
         
-        # Update last frame
-        self._last_frame = gray
+        if not self._use_cuda:
+            self._small_buf = np.empty((height, width, 3), dtype=np.uint8)
+            self._bufs = [np.empty((height, width), dtype=np.uint8) for _ in range(2)]
+            self._to_motion_gray(frame, self._bufs[0])
+            self._bufs[1][...] = self._bufs[0]
+
+    def _to_motion_gray(self, frame: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """
+        Downsample the frame to motion_resolution and write a single-channel
+        image into dst: the configured channel_index, or grayscale if unset.
+        """
+        # Downsample first; the diff is memory-bound so fewer pixels is the main win
+        small = cv2.resize(frame, self._camera_settings.motion_resolution,
+                           dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        channel = self._camera_settings.channel_index
+        if channel is None:
+            return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=dst)
+        # A strided copy of one channel, no per-pixel weighting
+        return cv2.extractChannel(small, channel, dst=dst)
+
+    def _to_motion_gray_cuda(self, dst):
+        """
+        GPU version of _to_motion_gray operating on the uploaded self._d_frame.
+        """
+        cv2.cuda.resize(self._d_frame, self._camera_settings.motion_resolution,
+                        dst=self._d_small, interpolation=cv2.INTER_AREA)
+        channel = self._camera_settings.channel_index
+        if channel is None:
+            return cv2.cuda.cvtColor(self._d_small, cv2.COLOR_BGR2GRAY, dst=dst)
+        # Split into the preallocated planes, then keep the configured one
+        planes = cv2.cuda.split(self._d_small, self._d_planes)
+        planes[channel].copyTo(dst)
+        return dst
+
+    def _motion_total(self, frame: np.ndarray) -> int:
+        """
+        Sum of absolute single-channel differences between frame and the
+        previous frame, advancing the current/previous buffer pair.
+        """
+        if self._use_cuda:
+            # Only the frame goes up and a single scalar comes back
+            self._d_frame.upload(frame)
+            gray = self._to_motion_gray_cuda(self._d_bufs[self._cur])
+            cv2.cuda.absdiff(gray, self._d_bufs[1 - self._cur], self._d_diff)
+            total = cv2.cuda.norm(self._d_diff, cv2.NORM_L1)
+        else:
+            gray = self._to_motion_gray(frame, self._bufs[self._cur])
+            # Sum of absolute differences in a single fused pass (no diff temporary)
+            total = cv2.norm(self._bufs[1 - self._cur], gray, cv2.NORM_L1)
         
-        # Determine movement type based on thresholds
-        movement_type = MovementType.NONE
-        confidence = min(movement / self._camera_settings.movement_threshold, 1.0)
+        # This frame becomes "previous"; the next one overwrites the older buffer
+        self._cur ^= 1
+        return int(total)
+
+    def _detect_movement(self, frame: np.ndarray) -> Dict[str, Any]:
+        """
+        Detect movement type in the frame.
+        """
+        total = self._motion_total(frame)
         
-        if movement > self._camera_settings.fall_threshold:
-            movement_type = MovementType.FALL
-        elif movement > self._camera_settings.running_threshold:
-            movement_type = MovementType.RUNNING
-        elif movement > self._camera_settings.movement_threshold:
-            movement_type = MovementType.WALKING
+        # Determine movement type based on the pre-scaled integer thresholds
+        code, confidence = _classify(total, self._thresholds, self._movement_sum)
         
         movement_data = {
-            "type": movement_type.value,
+            "type": _MOVEMENT_TYPES[code],
             "confidence": confidence,
-            "movement_value": float(movement)
+            "movement_value": total / self._motion_pixels
         }
         
         self._movement_history.append(movement_data)
@@ -174,8 +647,11 @@ class BeltTracking:
         return {
             "is_capturing": self._is_capturing,
             "capture_count": self._capture_count,
-            "settings": self._camera_settings.__dict__,
-            "recent_movements": self._movement_history[-10:] if self._movement_history else []
+            "failed_writes": self._failed_writes,
+            "dropped_captures": self._dropped_captures,
+            "settings": self._settings_snapshot,
+            "recent_movements": list(itertools.islice(
+                self._movement_history, max(0, len(self._movement_history) - 10), None))
         }
 
     def track_belt_open(self) -> Dict[str, Any]:
@@ -195,7 +671,7 @@ class BeltTracking:
             "is_open": self._is_open
         }
         
-        logger.info(f"Belt opened at {current_time}")
+        logger.info("Belt opened at %s", current_time)
         return tracking_data
 
     def track_belt_close(self) -> Dict[str, Any]:
@@ -226,7 +702,7 @@ class BeltTracking:
             "is_open": self._is_open
         }
         
-        logger.info(f"Belt closed at {current_time}, duration: {self._open_duration:.2f} seconds")
+        logger.info("Belt closed at %s, duration: %.2f seconds", current_time, self._open_duration)
         return tracking_data
 
     def get_tracking_stats(self) -> Dict[str, Any]: